@@ -11,6 +11,7 @@ Usage:
     python3 notifications.py check dms          # Check only DMs
     python3 notifications.py check feed         # Check only feed
     python3 notifications.py check --json       # Output as JSON
+    python3 notifications.py check --force      # Poll all posts, ignoring schedule
     python3 notifications.py reset              # Reset all timestamps
     python3 notifications.py config             # Show config file location
     python3 notifications.py track <post_id>    # Add a post to tracked list
@@ -18,14 +19,26 @@ Usage:
     python3 notifications.py list               # Show tracked posts
 """
 
+import base64
 import json
+import math
 import os
+import queue
+import random
 import sys
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from http.client import HTTPConnection, HTTPException, HTTPSConnection, RemoteDisconnected
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+try:
+    import orjson  # Optional, faster JSON; stdlib json is used otherwise
+except ImportError:
+    orjson = None
 
 # Paths - configurable via environment
 API_BASE = os.getenv("MOLTBOOK_API_BASE", "https://www.moltbook.com/api/v1")
@@ -36,6 +49,47 @@ CONFIG_FILE = Path(os.getenv("MOLTBOOK_CONFIG", "/workspace/.moltbook/notificati
 # Rate limit settings
 MAX_RETRIES = 3
 INITIAL_BACKOFF_MS = 400
+MAX_RETRY_AFTER_S = 60  # Upper bound on a server-requested Retry-After
+RATE_LIMIT_LOW_WATER = 2  # Slow down when X-RateLimit-Remaining drops to this
+
+# Max concurrent requests when fetching tracked posts
+MAX_CONCURRENCY = 8
+
+# Keep-alive connections shared by all threads; requests beyond this wait for one
+MAX_CONNECTIONS = 4
+MAX_REDIRECTS = 5
+
+# Adaptive per-post polling: active posts are polled more often, quiet ones back off
+POLL_INTERVAL_MIN_S = 60
+POLL_INTERVAL_MAX_S = 86400
+POLL_BACKOFF = 1.5
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize to indented JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def write_atomic(path, data):
+    """Write bytes via a temp file and rename, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def load_credentials():
@@ -44,13 +98,19 @@ def load_credentials():
         print(f"Error: No credentials found at {CREDENTIALS_FILE}", file=sys.stderr)
         print("Run the moltbook skill first to authenticate.", file=sys.stderr)
         sys.exit(1)
-    return json.loads(CREDENTIALS_FILE.read_text())
+    return json_loads(CREDENTIALS_FILE.read_bytes())
 
 
 def load_config():
     """Load notification config (tracked posts, etc.)."""
     if CONFIG_FILE.exists():
-        return json.loads(CONFIG_FILE.read_text())
+        config = json_loads(CONFIG_FILE.read_bytes())
+        # Bare post ids are accepted in the file; normalize to {"id", "label"}
+        config["tracked_posts"] = [
+            p if isinstance(p, dict) else {"id": p, "label": ""}
+            for p in config.get("tracked_posts", [])
+        ]
+        return config
     # Default config
     return {
         "tracked_posts": [
@@ -62,8 +122,7 @@ def load_config():
 
 def save_config(config):
     """Save config file."""
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(config, indent=2))
+    write_atomic(CONFIG_FILE, json_dumps(config))
 
 
 def save_default_config():
@@ -73,78 +132,336 @@ def save_default_config():
         print(f"Created default config at {CONFIG_FILE}")
 
 
-def load_state():
-    """Load notification state (last seen timestamps)."""
-    if STATE_FILE.exists():
-        return json.loads(STATE_FILE.read_text())
+def default_state():
+    """Return an empty notification state."""
     return {
         "last_check": None,
-        "posts": {},  # post_id -> last_seen_comment_count
+        "posts": {},  # post_id -> {count, last_change_at, next_poll_at, interval_s}
+        "posts_etag": {},  # post_id -> {"etag", "last_modified"} validators
         "dms_last_seen": None,
         "feed_last_seen": None,
     }
 
 
+def load_state():
+    """Load notification state (last seen timestamps)."""
+    if STATE_FILE.exists():
+        state = json_loads(STATE_FILE.read_bytes())
+        state.setdefault("posts_etag", {})
+        # Older state files stored a bare comment count per post
+        state["posts"] = {
+            pid: {"count": entry} if isinstance(entry, int) else entry
+            for pid, entry in state.get("posts", {}).items()
+        }
+        return state
+    return default_state()
+
+
 def save_state(state):
     """Save notification state."""
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
     state["last_check"] = datetime.now(tz=timezone.utc).isoformat()
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+    write_atomic(STATE_FILE, json_dumps(state))
+
+
+# (scheme, netloc) -> LifoQueue of idle keep-alive connections
+_idle_connections = {}
+_idle_lock = threading.Lock()
+_connection_slots = threading.BoundedSemaphore(MAX_CONNECTIONS)
+
+
+def new_connection(scheme, netloc):
+    """Open a connection to netloc, going through HTTP(S)_PROXY when configured."""
+    conn_class = HTTPSConnection if scheme == "https" else HTTPConnection
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(urlsplit(f"//{netloc}").hostname or ""):
+        return conn_class(netloc, timeout=30)
+
+    proxy = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    proxy_headers = {}
+    if proxy.username:
+        creds = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+        proxy_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode()
+    proxy_netloc = f"{proxy.hostname}:{proxy.port}" if proxy.port else proxy.hostname
+
+    if scheme == "https":
+        conn = HTTPSConnection(proxy_netloc, timeout=30)
+        conn.set_tunnel(netloc, headers=proxy_headers)
+    else:
+        # Plain HTTP proxies take the absolute URL as the request target
+        conn = HTTPConnection(proxy_netloc, timeout=30)
+        conn.proxy_headers = proxy_headers
+    return conn
+
+
+def acquire_connection(scheme, netloc):
+    """Check out an idle connection to netloc, or open one. Blocks at MAX_CONNECTIONS.
+
+    Returns (connection, reused).
+    """
+    _connection_slots.acquire()
+    with _idle_lock:
+        idle = _idle_connections.setdefault((scheme, netloc), queue.LifoQueue())
+    try:
+        return idle.get_nowait(), True
+    except queue.Empty:
+        pass
+    try:
+        return new_connection(scheme, netloc), False
+    except BaseException:
+        _connection_slots.release()
+        raise
+
+
+def release_connection(scheme, netloc, conn, reuse=True):
+    """Return a checked-out connection to the pool, or close it."""
+    if reuse:
+        with _idle_lock:
+            _idle_connections.setdefault((scheme, netloc), queue.LifoQueue()).put(conn)
+    else:
+        conn.close()
+    _connection_slots.release()
+
+
+def close_connections():
+    """Close every idle pooled connection."""
+    with _idle_lock:
+        pools = list(_idle_connections.values())
+        _idle_connections.clear()
+    for idle in pools:
+        while True:
+            try:
+                idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def send_get(conn, url, headers):
+    """Send a GET for url on conn and return the response, body unread."""
+    proxy_headers = getattr(conn, "proxy_headers", None)
+    if proxy_headers is not None:
+        target, headers = url, {**headers, **proxy_headers}
+    else:
+        parts = urlsplit(url)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    conn.request("GET", target, headers=headers)
+    return conn.getresponse()
+
+
+def http_get(url, headers):
+    """GET url over a pooled connection, following redirects. Returns (response, body)."""
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        conn, reused = acquire_connection(parts.scheme, parts.netloc)
+        try:
+            try:
+                resp = send_get(conn, url, headers)
+            except (RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                if not reused:
+                    raise
+                # The server closed the idle keep-alive connection; this isn't
+                # a real failure, so retry once on a fresh connection
+                conn.close()
+                conn = new_connection(parts.scheme, parts.netloc)
+                resp = send_get(conn, url, headers)
+            body = resp.read()  # Drain fully so the connection can be reused
+        except BaseException:
+            release_connection(parts.scheme, parts.netloc, conn, reuse=False)
+            raise
+        release_connection(parts.scheme, parts.netloc, conn, reuse=not resp.will_close)
+
+        location = resp.headers.get("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            url = urljoin(url, location)
+            continue
+        return resp, body
+    raise HTTPException(f"Too many redirects fetching {url}")
 
 
-def api_get(endpoint, api_key, retries=MAX_RETRIES):
-    """Make authenticated GET request to Moltbook API with retry/backoff."""
+def backoff_delay(backoff_ms, retry_after=None):
+    """Seconds to wait before a retry: the server's Retry-After, else jittered backoff."""
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = None  # HTTP-date form, use our own backoff
+        if delay is not None and math.isfinite(delay) and delay >= 0:
+            return min(delay, MAX_RETRY_AFTER_S)
+    # Jitter so clients sharing a rate limit don't retry in lockstep
+    return random.uniform(0.5, 1.5) * backoff_ms / 1000
+
+
+def throttle(headers):
+    """Pause briefly when the server reports we're close to the rate limit."""
+    remaining = headers.get("X-RateLimit-Remaining")
+    try:
+        if remaining is not None and int(remaining) <= RATE_LIMIT_LOW_WATER:
+            time.sleep(backoff_delay(INITIAL_BACKOFF_MS))
+    except ValueError:
+        pass
+
+
+def api_request(endpoint, api_key, headers=None, retries=MAX_RETRIES):
+    """Make authenticated GET request to Moltbook API with retry/backoff.
+
+    Returns (status, response_headers, data). data is None for 304/404
+    responses; status is None if the request failed outright.
+    """
     url = f"{API_BASE}{endpoint}"
-    req = Request(url, headers={"Authorization": f"Bearer {api_key}"})
+    headers = {"Authorization": f"Bearer {api_key}", **(headers or {})}
 
     backoff_ms = INITIAL_BACKOFF_MS
     last_error = None
 
     for attempt in range(retries):
         try:
-            with urlopen(req, timeout=30) as resp:
-                return json.loads(resp.read().decode())
-        except HTTPError as e:
-            last_error = e
-            if e.code == 429:  # Rate limited
-                time.sleep(backoff_ms / 1000)
-                backoff_ms = min(backoff_ms * 2.5, 10000)  # Cap at 10s
-                continue
-            elif e.code == 404:  # Post deleted
-                return None
-            else:
-                print(f"API error: {e.code} {e.reason}", file=sys.stderr)
-                return None
-        except URLError as e:
+            resp, body = http_get(url, headers)
+        except (HTTPException, OSError) as e:
             last_error = e
-            time.sleep(backoff_ms / 1000)
+            if attempt < retries - 1:  # No point waiting after the last attempt
+                time.sleep(backoff_delay(backoff_ms))
             backoff_ms = min(backoff_ms * 2.5, 10000)
             continue
         except Exception as e:
             print(f"Unexpected error: {e}", file=sys.stderr)
-            return None
+            return None, None, None
+
+        if resp.status == 429:  # Rate limited
+            last_error = f"{resp.status} {resp.reason}"
+            if attempt < retries - 1:
+                time.sleep(backoff_delay(backoff_ms, resp.headers.get("Retry-After")))
+            backoff_ms = min(backoff_ms * 2.5, 10000)  # Cap at 10s
+            continue
+
+        throttle(resp.headers)
+        if resp.status in (304, 404):  # Not modified / post deleted
+            return resp.status, resp.headers, None
+        elif resp.status >= 300:
+            print(f"API error: {resp.status} {resp.reason}", file=sys.stderr)
+            return None, None, None
+
+        try:
+            return resp.status, resp.headers, json_loads(body)
+        except Exception as e:
+            print(f"Unexpected error: {e}", file=sys.stderr)
+            return None, None, None
 
     if last_error:
         print(f"Failed after {retries} retries: {last_error}", file=sys.stderr)
-    return None
+    return None, None, None
+
+
+def api_get(endpoint, api_key, retries=MAX_RETRIES):
+    """Make authenticated GET request to Moltbook API, returning parsed JSON or None."""
+    _, _, data = api_request(endpoint, api_key, retries=retries)
+    return data
+
+
+def fetch_posts(post_ids, api_key, validators):
+    """Fetch posts concurrently with conditional GETs.
+
+    validators maps post_id -> {"etag", "last_modified"} from a previous fetch.
+    Duplicate ids are coalesced into a single request. Returns a dict of
+    post_id -> (status, headers, post) tuple, or the exception raised.
+    """
+    def fetch(post_id):
+        cached = validators.get(post_id, {})
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            return api_request(f"/posts/{post_id}", api_key, headers=headers)
+        except Exception as e:
+            return e
+
+    unique_ids = list(dict.fromkeys(post_ids))
+    if len(unique_ids) <= 1:
+        return {pid: fetch(pid) for pid in unique_ids}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(unique_ids))) as pool:
+        return dict(zip(unique_ids, pool.map(fetch, unique_ids)))
+
+
+def post_due(entry, now):
+    """Whether a post's adaptive polling interval has elapsed."""
+    next_poll_at = entry.get("next_poll_at")
+    return not next_poll_at or datetime.fromisoformat(next_poll_at) <= now
+
+
+def schedule_post(entry, changed, now):
+    """Adapt a post's polling interval to its observed comment activity."""
+    interval = entry.get("interval_s", POLL_INTERVAL_MIN_S)
+    if changed:
+        interval = max(POLL_INTERVAL_MIN_S, interval / 2)
+        entry["last_change_at"] = now.isoformat()
+    else:
+        interval = min(POLL_INTERVAL_MAX_S, interval * POLL_BACKOFF)
+    entry["interval_s"] = interval
+    entry["next_poll_at"] = (now + timedelta(seconds=interval)).isoformat()
+
+
+def dedupe_posts(tracked_posts):
+    """Drop repeated post ids, keeping the first entry. Warns about duplicates."""
+    seen = set()
+    unique = []
+    for p in tracked_posts:
+        post_id = p["id"]
+        if post_id in seen:
+            print(f"Warning: post {post_id} is tracked more than once in {CONFIG_FILE}", file=sys.stderr)
+            continue
+        seen.add(post_id)
+        unique.append(p)
+    return unique
 
 
-def check_post_comments(api_key, state, tracked_posts):
-    """Check for new comments on tracked posts."""
+def check_post_comments(api_key, state, tracked_posts, force=False):
+    """Check for new comments on tracked posts that are due for polling."""
     new_comments = []
+    now = datetime.now(tz=timezone.utc)
+    tracked_posts = dedupe_posts(tracked_posts)
+
+    if not force:
+        tracked_posts = [
+            p for p in tracked_posts
+            if post_due(state["posts"].get(p["id"], {}), now)
+        ]
 
-    for post_info in tracked_posts:
-        post_id = post_info["id"] if isinstance(post_info, dict) else post_info
-        label = post_info.get("label", "") if isinstance(post_info, dict) else ""
+    post_ids = [p["id"] for p in tracked_posts]
+    # Only revalidate posts whose comment count we already know
+    validators = {
+        pid: v for pid, v in state["posts_etag"].items() if pid in state["posts"]
+    }
+    results = fetch_posts(post_ids, api_key, validators)
+
+    for post_info, post_id in zip(tracked_posts, post_ids):
+        result = results[post_id]
+        label = post_info.get("label", "")
+
+        if isinstance(result, Exception):
+            print(f"Error checking post {post_id}: {result}", file=sys.stderr)
+            continue
 
         try:
-            post = api_get(f"/posts/{post_id}", api_key)
+            status, headers, post = result
+            if status == 304:
+                # Unchanged since last fetch, nothing new
+                schedule_post(state["posts"][post_id], False, now)
+                continue
             if not post:
                 # Post might be deleted, skip gracefully
                 continue
 
+            etag = headers.get("ETag")
+            last_modified = headers.get("Last-Modified")
+            if etag or last_modified:
+                state["posts_etag"][post_id] = {"etag": etag, "last_modified": last_modified}
+            else:
+                state["posts_etag"].pop(post_id, None)
+
             comments = post.get("comments", [])
-            last_seen_count = state["posts"].get(post_id, 0)
+            entry = state["posts"].setdefault(post_id, {"count": 0})
+            last_seen_count = entry.get("count", 0)
 
             if len(comments) > last_seen_count:
                 new = comments[last_seen_count:]
@@ -157,7 +474,10 @@ def check_post_comments(api_key, state, tracked_posts):
                         "content": c.get("content", ""),
                         "created_at": c.get("created_at"),
                     })
-                state["posts"][post_id] = len(comments)
+                entry["count"] = len(comments)
+                schedule_post(entry, True, now)
+            else:
+                schedule_post(entry, False, now)
         except Exception as e:
             print(f"Error checking post {post_id}: {e}", file=sys.stderr)
             continue
@@ -249,16 +569,12 @@ def main():
 
     # Parse flags
     json_output = "--json" in sys.argv
+    force = "--force" in sys.argv
     quiet = "--quiet" in sys.argv or "-q" in sys.argv
     args = [a for a in sys.argv[2:] if not a.startswith("-")]
 
     if command == "reset":
-        save_state({
-            "last_check": None,
-            "posts": {},
-            "dms_last_seen": None,
-            "feed_last_seen": None,
-        })
+        save_state(default_state())
         if not quiet:
             print("Notification state reset.")
         return
@@ -283,7 +599,7 @@ def main():
                 label = sys.argv[label_idx + 1]
         config = load_config()
         # Check if already tracked
-        existing_ids = [p["id"] if isinstance(p, dict) else p for p in config["tracked_posts"]]
+        existing_ids = [p["id"] for p in config["tracked_posts"]]
         if post_id in existing_ids:
             print(f"Post {post_id} is already tracked.")
             return
@@ -301,7 +617,7 @@ def main():
         original_len = len(config["tracked_posts"])
         config["tracked_posts"] = [
             p for p in config["tracked_posts"]
-            if (p["id"] if isinstance(p, dict) else p) != post_id
+            if p["id"] != post_id
         ]
         if len(config["tracked_posts"]) == original_len:
             print(f"Post {post_id} was not being tracked.")
@@ -318,8 +634,8 @@ def main():
             return
         print(f"Tracking {len(tracked)} posts:")
         for p in tracked:
-            pid = p["id"] if isinstance(p, dict) else p
-            label = p.get("label", "") if isinstance(p, dict) else ""
+            pid = p["id"]
+            label = p.get("label", "")
             print(f"  {pid}" + (f"  # {label}" if label else ""))
         return
 
@@ -338,22 +654,25 @@ def main():
 
     tracked_posts = config.get("tracked_posts", [])
 
-    results = {}
-
-    if check_type in ("all", "posts"):
-        results["comments"] = check_post_comments(api_key, state, tracked_posts)
-        if not json_output and not quiet:
-            print_notifications("Post comments", results["comments"])
+    # result key -> (check type, display label, check function)
+    checks = {
+        "comments": ("posts", "Post comments", lambda: check_post_comments(api_key, state, tracked_posts, force=force)),
+        "dms": ("dms", "DMs", lambda: check_dms(api_key, state)),
+        "feed": ("feed", "Feed", lambda: check_feed(api_key, state)),
+    }
+    selected = {key: c for key, c in checks.items() if check_type in ("all", c[0])}
 
-    if check_type in ("all", "dms"):
-        results["dms"] = check_dms(api_key, state)
-        if not json_output and not quiet:
-            print_notifications("DMs", results["dms"])
+    # Each check updates its own part of the state, so run them concurrently
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(selected))) as pool:
+            futures = {key: pool.submit(run) for key, (_, _, run) in selected.items()}
+        results = {key: future.result() for key, future in futures.items()}
+    finally:
+        close_connections()
 
-    if check_type in ("all", "feed"):
-        results["feed"] = check_feed(api_key, state)
-        if not json_output and not quiet:
-            print_notifications("Feed", results["feed"])
+    if not json_output and not quiet:
+        for key, items in results.items():
+            print_notifications(selected[key][1], items)
 
     save_state(state)
 
@@ -367,7 +686,7 @@ def main():
             "total": total,
             "api_base": API_BASE,
         }
-        print(json.dumps(output, indent=2))
+        print(json_dumps(output).decode())
     elif not quiet:
         print(f"\nTotal: {total} new notifications")
         if total == 0:
@@ -12,10 +12,17 @@ Usage:
 """
 
 import json
+import math
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson  # Optional, faster JSON; stdlib json is used otherwise
+except ImportError:
+    orjson = None
+
 LIMITS_FILE = Path("/workspace/.usage-limits.json")
 
 # Plan limits (credits per window) - for reference/fallback
@@ -24,15 +31,54 @@ PLAN_LIMITS = {
     "max5x": {"5h": 3_300_000, "7d": 41_666_700},
     "max20x": {"5h": 11_000_000, "7d": 83_333_300},
 }
+PLAN_5H = {plan: limits["5h"] for plan, limits in PLAN_LIMITS.items()}
+PLAN_7D = {plan: limits["7d"] for plan, limits in PLAN_LIMITS.items()}
+
+# Capacity levels, most severe first: (min 5h pct, min 7d pct, level, advice)
+CAPACITY_LEVELS = (
+    (90, 95, "critical", "Avoid non-essential work. Focus on completing current task only."),
+    (70, 80, "conserve", "Limit exploration. Prioritize user requests over autonomous actions."),
+    (50, 60, "moderate", "Light exploration OK. Avoid expensive operations."),
+)
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize to indented JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def compute_pct(plan, used_5h, used_7d):
+    """Usage percentages for both windows against the plan's reference limits."""
+    return used_5h * 100.0 / PLAN_5H[plan], used_7d * 100.0 / PLAN_7D[plan]
 
 
 def load_limits():
     """Load usage limits from daemon-provided file."""
-    if not LIMITS_FILE.exists():
+    # Raw fd I/O: this small file is read on every invocation, skip the io stack
+    try:
+        fd = os.open(LIMITS_FILE, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    except OSError:
         return None
     try:
-        return json.loads(LIMITS_FILE.read_text())
-    except:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while chunk := os.read(fd, size + 1):
+            chunks.append(chunk)
+        raw = b"".join(chunks)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    try:
+        return json_loads(raw)
+    except ValueError:  # Malformed JSON (json and orjson decode errors both subclass it)
         return None
 
 
@@ -44,23 +90,22 @@ def capacity_recommendation(data):
     five_h = data.get("5h", {}).get("pct", 0)
     seven_d = data.get("7d", {}).get("pct", 0)
 
-    if five_h >= 90 or seven_d >= 95:
-        return "critical", "Avoid non-essential work. Focus on completing current task only."
-    elif five_h >= 70 or seven_d >= 80:
-        return "conserve", "Limit exploration. Prioritize user requests over autonomous actions."
-    elif five_h >= 50 or seven_d >= 60:
-        return "moderate", "Light exploration OK. Avoid expensive operations."
-    else:
-        return "available", "Capacity available. Exploration and autonomous work are fine."
+    for min_five_h, min_seven_d, level, advice in CAPACITY_LEVELS:
+        if five_h >= min_five_h or seven_d >= min_seven_d:
+            return level, advice
+    return "available", "Capacity available. Exploration and autonomous work are fine."
+
+
+# (divisor, suffix) per power of 1000
+NUMBER_SUFFIXES = ((1, ""), (1_000, "K"), (1_000_000, "M"), (1_000_000_000, "G"))
 
 
 def format_number(n):
-    """Format large numbers with K/M suffix."""
-    if n >= 1_000_000:
-        return f"{n/1_000_000:.1f}M"
-    elif n >= 1_000:
-        return f"{n/1_000:.1f}K"
-    return str(n)
+    """Format large numbers with K/M/G suffix."""
+    if n < 1_000 or not math.isfinite(n):
+        return str(n)
+    divisor, suffix = NUMBER_SUFFIXES[min(int(math.log10(n)) // 3, len(NUMBER_SUFFIXES) - 1)]
+    return f"{n/divisor:.1f}{suffix}"
 
 
 def print_status():
@@ -68,30 +113,36 @@ def print_status():
     data = load_limits()
 
     if not data:
-        print("No usage data found at /workspace/.usage-limits.json")
-        print("The daemon should populate this file after each message.")
+        sys.stdout.write(
+            "No usage data found at /workspace/.usage-limits.json\n"
+            "The daemon should populate this file after each message.\n"
+        )
         return
 
     five_h = data.get("5h", {})
     seven_d = data.get("7d", {})
-
-    print("Claude Usage Limits (from daemon)")
-    print("=" * 40)
-    print(f"Plan: {data.get('plan', 'unknown')}")
-    print()
-    print(f"5-hour window:  {five_h.get('pct', 0):.1f}%")
-    print(f"  Credits:      {format_number(five_h.get('used', 0))} / {format_number(five_h.get('limit', 0))}")
-    print()
-    print(f"7-day window:   {seven_d.get('pct', 0):.1f}%")
-    print(f"  Credits:      {format_number(seven_d.get('used', 0))} / {format_number(seven_d.get('limit', 0))}")
-    print()
-
     level, advice = capacity_recommendation(data)
-    print(f"Status: {level.upper()}")
-    print(f"Advice: {advice}")
+
+    # Build the whole report and emit it with a single write
+    lines = [
+        "Claude Usage Limits (from daemon)",
+        "=" * 40,
+        f"Plan: {data.get('plan', 'unknown')}",
+        "",
+        f"5-hour window:  {five_h.get('pct', 0):.1f}%",
+        f"  Credits:      {format_number(five_h.get('used', 0))} / {format_number(five_h.get('limit', 0))}",
+        "",
+        f"7-day window:   {seven_d.get('pct', 0):.1f}%",
+        f"  Credits:      {format_number(seven_d.get('used', 0))} / {format_number(seven_d.get('limit', 0))}",
+        "",
+        f"Status: {level.upper()}",
+        f"Advice: {advice}",
+    ]
 
     if data.get("updated_at"):
-        print(f"\nLast updated: {data['updated_at']}")
+        lines += ["", f"Last updated: {data['updated_at']}"]
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def should_explore():
@@ -117,28 +168,30 @@ def print_json():
         level, advice = capacity_recommendation(data)
         data["status"] = level
         data["advice"] = advice
-        print(json.dumps(data, indent=2))
+        print(json_dumps(data).decode())
     else:
         print(json.dumps({"error": "No usage data available"}))
 
 
+COMMANDS = {
+    "status": print_status,
+    "should-explore": lambda: sys.exit(should_explore()),
+    "json": print_json,
+}
+
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
 
     cmd = sys.argv[1]
-
-    if cmd == "status":
-        print_status()
-    elif cmd == "should-explore":
-        sys.exit(should_explore())
-    elif cmd == "json":
-        print_json()
-    else:
+    handler = COMMANDS.get(cmd)
+    if handler is None:
         print(f"Unknown command: {cmd}")
         print(__doc__)
         sys.exit(1)
+    handler()
 
 
 if __name__ == "__main__":
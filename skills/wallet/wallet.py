@@ -11,9 +11,12 @@ Supports Base mainnet and Base Sepolia testnet.
 Private key stored in /workspace/.secrets/wallet.key (hex, no 0x prefix).
 """
 
+import hashlib
 import json
 import os
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 
 # Lazy import web3 to allow --help without dependencies
@@ -21,6 +24,23 @@ def get_web3():
     from web3 import Web3
     return Web3
 
+
+def get_account_class():
+    # Key handling only needs eth_account, which is much lighter than web3
+    from eth_account import Account
+    return Account
+
+
+@lru_cache(maxsize=1)
+def get_http_session():
+    """Shared keep-alive HTTP session, so RPC calls reuse one TLS connection."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return session
+
 # Configuration
 NETWORKS = {
     "base": {
@@ -36,49 +56,147 @@ NETWORKS = {
 }
 
 DEFAULT_NETWORK = "base-sepolia"  # Start on testnet
+RPC_TIMEOUT_S = 10
+RECEIPT_POLL_S = 1.0  # Base makes a block every ~2s; web3's default polls every 0.1s
 SECRETS_DIR = Path("/workspace/.secrets")
 KEY_FILE = SECRETS_DIR / "wallet.key"
+ADDRESS_FILE = SECRETS_DIR / "wallet.addr"  # "<address> <key fingerprint>", cached
+RPC_CACHE_FILE = Path("/workspace/.cache/wallet-rpc.json")
+BALANCE_TTL_S = 10
+
 
+def parse_private_key(text: bytes) -> bytes:
+    """Decode a hex private key, with or without 0x prefix, to raw bytes."""
+    key = text.strip()
+    if key[:2] in (b"0x", b"0X"):
+        key = key[2:]
+    return bytes.fromhex(key.decode("ascii"))
 
-def load_private_key() -> str:
-    """Load private key from file."""
+
+def key_fingerprint(key: bytes) -> str:
+    """Hash of the raw key bytes, tying a cached address to the key it came from."""
+    return hashlib.sha256(key).hexdigest()
+
+
+def load_private_key() -> bytes:
+    """Load the raw private key bytes from file."""
     if not KEY_FILE.exists():
         print(f"Error: No private key found at {KEY_FILE}")
         print("Generate one with: wallet.py generate")
         sys.exit(1)
 
-    key = KEY_FILE.read_text().strip()
-    if key.startswith("0x"):
-        key = key[2:]
-    return key
+    try:
+        return parse_private_key(KEY_FILE.read_bytes())
+    except ValueError:
+        print(f"Error: Private key in {KEY_FILE} is not valid hex")
+        sys.exit(1)
 
 
-def save_private_key(key: str):
-    """Save private key to file with restricted permissions."""
+def save_private_key(key: str, address: str):
+    """Save private key to file with restricted permissions, plus its address."""
     SECRETS_DIR.mkdir(parents=True, exist_ok=True)
     KEY_FILE.write_text(key)
     KEY_FILE.chmod(0o600)
+    ADDRESS_FILE.write_text(f"{address} {key_fingerprint(parse_private_key(key.encode()))}\n")
 
 
-def get_web3_and_account(network: str = DEFAULT_NETWORK):
-    """Initialize Web3 and account."""
-    Web3 = get_web3()
+def load_address() -> str:
+    """Load the wallet address, re-deriving it unless the cache matches the current key."""
+    key = load_private_key()
+    fingerprint = key_fingerprint(key)
+    try:
+        address, cached_fingerprint = ADDRESS_FILE.read_text().split()
+        if cached_fingerprint == fingerprint:
+            return address
+    except (OSError, ValueError):
+        pass  # Missing, or written before fingerprints were stored
+
+    address = get_account_class().from_key(key).address
+    try:
+        ADDRESS_FILE.write_text(f"{address} {fingerprint}\n")
+    except OSError:
+        pass  # Caching is best-effort, e.g. on a read-only secrets dir
+    return address
+
+
+def load_account():
+    """Derive the account from the stored private key, without web3 or network access."""
+    return get_account_class().from_key(load_private_key())
 
+
+def get_network_config(network: str) -> dict:
+    """Look up a network's config, exiting on unknown names."""
     if network not in NETWORKS:
         print(f"Error: Unknown network '{network}'. Available: {list(NETWORKS.keys())}")
         sys.exit(1)
+    return NETWORKS[network]
 
-    config = NETWORKS[network]
-    w3 = Web3(Web3.HTTPProvider(config["rpc"]))
 
-    if not w3.is_connected():
-        print(f"Error: Could not connect to {config['rpc']}")
-        sys.exit(1)
+def connect_web3(config: dict):
+    """Create a Web3 client for a network's RPC endpoint, without touching the key."""
+    Web3 = get_web3()
+    provider = Web3.HTTPProvider(
+        config["rpc"],
+        session=get_http_session(),
+        request_kwargs={"timeout": RPC_TIMEOUT_S},
+    )
+    # No is_connected() probe: the first real RPC reports connection failures
+    return Web3(provider)
 
-    key = load_private_key()
-    account = w3.eth.account.from_key(key)
 
-    return w3, account, config
+def get_web3_and_account(network: str = DEFAULT_NETWORK):
+    """Initialize Web3 and account."""
+    config = get_network_config(network)
+    return connect_web3(config), load_account(), config
+
+
+def rpc_connection_errors():
+    """Exception types raised when the RPC endpoint can't be reached."""
+    from requests.exceptions import ConnectionError, Timeout
+    return (ConnectionError, Timeout)
+
+
+def exit_unreachable(config: dict):
+    """Report an unreachable RPC endpoint and exit."""
+    print(f"Error: Could not connect to {config['rpc']}")
+    sys.exit(1)
+
+
+def load_rpc_cache() -> dict:
+    """Load cached RPC results: key -> [fetched_at, value]."""
+    try:
+        return json.loads(RPC_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def cached_rpc(key: str, ttl: float, fetch):
+    """Return a cached RPC result younger than ttl seconds, else fetch and cache it."""
+    cache = load_rpc_cache()
+    now = time.time()
+    entry = cache.get(key)
+    if entry and now - entry[0] < ttl:
+        return entry[1]
+
+    value = fetch()
+    cache[key] = [now, value]
+    try:
+        RPC_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        RPC_CACHE_FILE.write_text(json.dumps(cache))
+    except OSError:
+        pass  # Caching is best-effort; the fetched value is still good
+    return value
+
+
+def invalidate_rpc_cache(network: str):
+    """Drop cached results for a network, e.g. after sending a transaction."""
+    cache = load_rpc_cache()
+    kept = {k: v for k, v in cache.items() if not k.startswith(f"{network}:")}
+    if len(kept) != len(cache):
+        try:
+            RPC_CACHE_FILE.write_text(json.dumps(kept))
+        except OSError:
+            pass  # Stale entries expire within their TTL anyway
 
 
 def cmd_generate():
@@ -88,9 +206,8 @@ def cmd_generate():
         print("Delete it first if you want to generate a new one.")
         sys.exit(1)
 
-    Web3 = get_web3()
-    account = Web3().eth.account.create()
-    save_private_key(account.key.hex())
+    account = get_account_class().create()
+    save_private_key(account.key.hex(), account.address)
 
     print(f"Generated new wallet!")
     print(f"Address: {account.address}")
@@ -102,45 +219,81 @@ def cmd_generate():
 
 def cmd_address(network: str = DEFAULT_NETWORK):
     """Show wallet address."""
-    w3, account, config = get_web3_and_account(network)
-    print(f"Address: {account.address}")
-    print(f"Explorer: {config['explorer']}/address/{account.address}")
+    config = get_network_config(network)
+    address = load_address()
+    print(f"Address: {address}")
+    print(f"Explorer: {config['explorer']}/address/{address}")
 
 
 def cmd_balance(network: str = DEFAULT_NETWORK):
     """Check wallet balance."""
-    w3, account, config = get_web3_and_account(network)
-
-    balance_wei = w3.eth.get_balance(account.address)
-    balance_eth = w3.from_wei(balance_wei, "ether")
+    from eth_utils import from_wei
+
+    config = get_network_config(network)
+    address = load_address()
+
+    # Served from cache within BALANCE_TTL_S, without connecting to the RPC
+    try:
+        balance_wei = cached_rpc(
+            f"{network}:eth_getBalance:{address}",
+            BALANCE_TTL_S,
+            lambda: connect_web3(config).eth.get_balance(address),
+        )
+    except rpc_connection_errors():
+        exit_unreachable(config)
+    balance_eth = from_wei(balance_wei, "ether")
 
     print(f"Network: {network}")
-    print(f"Address: {account.address}")
+    print(f"Address: {address}")
     print(f"Balance: {balance_eth} ETH")
 
 
+def checksum_address(address: str):
+    """Return the EIP-55 checksummed address, or None if it isn't a valid address."""
+    from eth_utils import is_address, to_checksum_address
+
+    if not is_address(address):
+        return None
+    return to_checksum_address(address)
+
+
+def fetch_send_params(w3, address):
+    """Fetch balance, nonce and gas price in a single JSON-RPC batch request."""
+    if not hasattr(w3, "batch_requests"):  # web3 < 6.14, no batching
+        return w3.eth.get_balance(address), w3.eth.get_transaction_count(address), w3.eth.gas_price
+
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.get_balance(address))
+        batch.add(w3.eth.get_transaction_count(address))
+        batch.add(w3.eth.gas_price)
+        balance, nonce, gas_price = batch.execute()
+    return balance, nonce, gas_price
+
+
 def cmd_send(to_address: str, amount_eth: str, network: str = DEFAULT_NETWORK):
     """Send ETH to an address."""
     w3, account, config = get_web3_and_account(network)
 
     # Validate address
-    if not w3.is_address(to_address):
+    checksummed = checksum_address(to_address)
+    if checksummed is None:
         print(f"Error: Invalid address '{to_address}'")
         sys.exit(1)
 
-    to_address = w3.to_checksum_address(to_address)
+    to_address = checksummed
     amount_wei = w3.to_wei(float(amount_eth), "ether")
 
+    try:
+        balance, nonce, gas_price = fetch_send_params(w3, account.address)
+    except rpc_connection_errors():
+        exit_unreachable(config)
+
     # Check balance
-    balance = w3.eth.get_balance(account.address)
     if balance < amount_wei:
         print(f"Error: Insufficient balance. Have {w3.from_wei(balance, 'ether')} ETH, need {amount_eth} ETH")
         sys.exit(1)
 
     # Build transaction
-    nonce = w3.eth.get_transaction_count(account.address)
-    gas_price = w3.eth.gas_price
-
     tx = {
         "nonce": nonce,
         "to": to_address,
@@ -165,10 +318,11 @@ def cmd_send(to_address: str, amount_eth: str, network: str = DEFAULT_NETWORK):
     print(f"Amount: {amount_eth} ETH")
     print(f"TX Hash: {tx_hash.hex()}")
     print(f"Explorer: {config['explorer']}/tx/{tx_hash.hex()}")
+    invalidate_rpc_cache(network)  # The cached balance is now stale
 
     # Wait for confirmation
     print("Waiting for confirmation...")
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120, poll_latency=RECEIPT_POLL_S)
 
     if receipt["status"] == 1:
         print(f"Confirmed in block {receipt['blockNumber']}")